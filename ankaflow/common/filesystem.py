@@ -1,12 +1,46 @@
 import typing as t
+import fnmatch
+import functools
+import os
 import pathlib
+import re
 import sys
 from io import FileIO, StringIO
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, Iterable, List, Tuple, Union
 
 IS_PYODIDE = sys.platform == "emscripten"
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(glob_pattern: str) -> t.Pattern[str]:
+    return re.compile(fnmatch.translate(glob_pattern))
+
+
+def _iter_glob(root: pathlib.Path, glob_pattern: str) -> t.Iterator[pathlib.Path]:
+    """
+    Yields files under root matching the glob pattern.
+
+    Flat patterns (no directory part) are matched against a single
+    directory scan with a cached compiled regex; anything else is
+    delegated to pathlib's glob.
+    """
+    if "/" in glob_pattern or "**" in glob_pattern:
+        for path in root.glob(glob_pattern):
+            if path.is_file():
+                yield path
+        return
+    match = _compile_glob(glob_pattern).match
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        # Same as pathlib's glob: a missing root has no matches
+        return
+    with entries:
+        for entry in entries:
+            if match(entry.name) and entry.is_file():
+                yield root / entry.name
+
+
 @t.runtime_checkable
 class BaseFileSystem(t.Protocol):
     @property
@@ -127,22 +161,21 @@ class BrowserFileSystem:
 
     def list_files(self, glob_pattern: str = "*") -> List[Dict[str, Union[str, float]]]:
         files = []
-        for path in self.root_path.glob(glob_pattern):
-            if path.is_file():
-                stat_result = path.stat()
-                try:
-                    path.read_text(encoding="utf-8")
-                    file_type = "text/plain"
-                except UnicodeDecodeError:
-                    file_type = "application/octet-stream"
-                files.append(
-                    {
-                        "name": str(path.relative_to(self.root_path)),
-                        "created": stat_result.st_ctime,
-                        "modified": stat_result.st_mtime,
-                        "mime_type": file_type,
-                    }
-                )
+        for path in _iter_glob(self.root_path, glob_pattern):
+            stat_result = path.stat()
+            try:
+                path.read_text(encoding="utf-8")
+                file_type = "text/plain"
+            except UnicodeDecodeError:
+                file_type = "application/octet-stream"
+            files.append(
+                {
+                    "name": str(path.relative_to(self.root_path)),
+                    "created": stat_result.st_ctime,
+                    "modified": stat_result.st_mtime,
+                    "mime_type": file_type,
+                }
+            )
         return files
 
     def delete_file(self, filename: str) -> bool:
@@ -154,10 +187,9 @@ class BrowserFileSystem:
 
     def delete_files(self, glob_pattern: str) -> int:
         deleted_count = 0
-        for path in self.root_path.glob(glob_pattern):
-            if path.is_file():
-                path.unlink()
-                deleted_count += 1
+        for path in list(_iter_glob(self.root_path, glob_pattern)):
+            path.unlink()
+            deleted_count += 1
         return deleted_count
 
 
@@ -337,22 +369,21 @@ class LocalFileSystem:
                 The 'name' is relative to the specified root path.
         """
         files: List[Dict[str, Union[str, float]]] = []
-        for path in self.root_path.glob(glob_pattern):
-            if path.is_file():
-                stat_result = path.stat()
-                try:
-                    path.read_text(encoding="utf-8")
-                    file_type = "text/plain"
-                except UnicodeDecodeError:
-                    file_type = "application/octet-stream"
-                files.append(
-                    {
-                        "name": str(path.relative_to(self.root_path)),
-                        "created": stat_result.st_ctime,
-                        "modified": stat_result.st_mtime,
-                        "mime_type": file_type,
-                    }
-                )
+        for path in _iter_glob(self.root_path, glob_pattern):
+            stat_result = path.stat()
+            try:
+                path.read_text(encoding="utf-8")
+                file_type = "text/plain"
+            except UnicodeDecodeError:
+                file_type = "application/octet-stream"
+            files.append(
+                {
+                    "name": str(path.relative_to(self.root_path)),
+                    "created": stat_result.st_ctime,
+                    "modified": stat_result.st_mtime,
+                    "mime_type": file_type,
+                }
+            )
         return files
 
     def delete_file(self, filename: str) -> bool:
@@ -383,10 +414,9 @@ class LocalFileSystem:
             The number of files deleted.
         """
         deleted_count: int = 0
-        for path in self.root_path.glob(glob_pattern):
-            if path.is_file():
-                path.unlink()
-                deleted_count += 1
+        for path in list(_iter_glob(self.root_path, glob_pattern)):
+            path.unlink()
+            deleted_count += 1
         return deleted_count
 
 
@@ -437,6 +467,24 @@ class FileSystem:
         """
         return self._fs.save_file(filename, content, mime_type)
 
+    async def save_files(
+        self, files: Iterable[Tuple[str, Union[str, bytes], str]]
+    ) -> List[Dict[str, Union[str, float]]]:
+        """
+        Saves several files in one call.
+
+        The underlying backends are synchronous, so batching the writes
+        behind a single await avoids a coroutine round-trip per file.
+
+        Args:
+            files: Iterable of (filename, content, mime_type) tuples.
+
+        Returns:
+            A list of metadata dictionaries in input order.
+        """
+        save = self._fs.save_file
+        return [save(name, content, mime) for name, content, mime in files]
+
     async def get_file(
         self, filename: str, mode="text/plain"
     ) -> Optional[Dict[str, Union[str, bytes, float]]]:
@@ -322,6 +322,28 @@ class FTPPath(RemotePath):
         return self.path
 
 
+# URI scheme -> remote path class; anything else is a local path
+_SCHEMES: t.Dict[str, t.Type[RemotePath]] = {
+    "s3": S3Path,
+    "gs": GSPath,
+    "http": HTTPPath,
+    "https": HTTPPath,
+    "ftp": FTPPath,
+}
+_MAX_SCHEME_LEN = max(len(scheme) for scheme in _SCHEMES)
+
+
+def _make_from_str(path: str) -> CommonPath:
+    i = path.find("://", 0, _MAX_SCHEME_LEN + 3)
+    if i > 0:
+        cls = _SCHEMES.get(path[:i])
+        if cls is not None:
+            return cls(path)
+    if path.startswith("file://"):
+        return LocalPath(urllib.parse.urlparse(path).path)
+    return LocalPath(path)
+
+
 class PathFactory:
     """Factory class to create CommonPath objects."""
 
@@ -344,42 +366,10 @@ class PathFactory:
         if isinstance(path, pathlib.Path):
             return LocalPath(path)
         if isinstance(path, str):
-            if PathFactory._is_absolute_s3(path):
-                return S3Path(path)
-            elif PathFactory._is_absolute_gs(path):
-                return GSPath(path)
-            elif PathFactory._is_absolute_http(path):
-                return HTTPPath(path)
-            elif PathFactory._is_absolute_ftp(path):
-                return FTPPath(path)
-            elif PathFactory._is_absolute_file(path):
-                return LocalPath(urllib.parse.urlparse(path).path)
-            else:
-                return LocalPath(path)
+            return _make_from_str(path)
         else:
             raise TypeError(f"Unsupported path type: {type(path)}")
 
-    @staticmethod
-    def _is_absolute_s3(path_str: str) -> bool:
-        """Checks if a string represents an absolute S3 path."""
-        return path_str.startswith("s3://")
-
-    @staticmethod
-    def _is_absolute_gs(path_str: str) -> bool:
-        """Checks if a string represents an absolute GS path."""
-        return path_str.startswith("gs://")
-
-    @staticmethod
-    def _is_absolute_http(path_str: str) -> bool:
-        """Checks if a string represents an absolute HTTP/HTTPS path."""
-        return path_str.startswith("http://") or path_str.startswith("https://")
 
-    @staticmethod
-    def _is_absolute_ftp(path_str: str) -> bool:
-        """Checks if a string represents an absolute FTP path."""
-        return path_str.startswith("ftp://")
-
-    @staticmethod
-    def _is_absolute_file(path_str: str) -> bool:
-        """Checks if a string represents an absolute file:// path."""
-        return path_str.startswith("file://")
+make = PathFactory.make
+"""Shortcut for ``PathFactory.make``."""
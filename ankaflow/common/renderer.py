@@ -1,4 +1,5 @@
 import typing as t
+import functools
 import json
 import logging
 
@@ -8,13 +9,49 @@ from .security import StrictEnvironment, secure_context, jinja_sanitize
 log = logging.getLogger(__name__)
 
 
+def _make_environment() -> StrictEnvironment:
+    env = StrictEnvironment(
+        variable_start_string="<<",
+        variable_end_string=">>",
+        block_start_string="<%",
+        block_end_string="%>",
+        comment_start_string="<#",
+        comment_end_string="#>",
+    )
+    # Register filters
+    env.filters["bool"] = lambda v: bool(v)
+    env.filters["int"] = lambda v: int(v)
+    env.filters["float"] = lambda v: float(v)
+    return env
+
+
+# Delimiters configured in _make_environment(); strings without any of
+# them render to themselves and never need to reach Jinja.
+_TEMPLATE_MARKERS = ("<<", "<%", "<#")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(source: str):
+    return Renderer.environment().from_string(source)
+
+
 class Renderer:
+    # Sandboxed environment is built on first use and shared by all
+    # renderers; it holds no per-render state.
+    _env: t.Optional[StrictEnvironment] = None
+
     def __init__(
         self,
         **kwargs
     ):
         self.kwargs = kwargs
 
+    @classmethod
+    def environment(cls) -> StrictEnvironment:
+        if Renderer._env is None:
+            Renderer._env = _make_environment()
+        return Renderer._env
+
     def render_string(
         self,
         string: str,
@@ -23,29 +60,19 @@ class Renderer:
     ) -> t.Any:
         if not isinstance(string, str):
             return string
-        safe_kwargs = {}
-        for k in self.kwargs:
-            if k.startswith("__"):
-                safe_kwargs[k] = None
-            else:
-                safe_kwargs[k] = jinja_sanitize(self.kwargs[k])
-
-        with secure_context():
-            env = StrictEnvironment(
-                variable_start_string="<<",
-                variable_end_string=">>",
-                block_start_string="<%",
-                block_end_string="%>",
-                comment_start_string="<#",
-                comment_end_string="#>",
-            )
-            # Register filters
-            env.filters["bool"] = lambda v: bool(v)
-            env.filters["int"] = lambda v: int(v)
-            env.filters["float"] = lambda v: float(v)
-
-            tmpl = env.from_string(string)
-            rendered = tmpl.render(**safe_kwargs).strip()
+        if any(marker in string for marker in _TEMPLATE_MARKERS):
+            safe_kwargs = {}
+            for k in self.kwargs:
+                if k.startswith("__"):
+                    safe_kwargs[k] = None
+                else:
+                    safe_kwargs[k] = jinja_sanitize(self.kwargs[k])
+
+            with secure_context():
+                tmpl = _compile(string)
+                rendered = tmpl.render(**safe_kwargs).strip()
+        else:
+            rendered = string.strip()
 
         if squash_whitespace:
             rendered = " ".join(rendered.split())
@@ -4,6 +4,7 @@ import asyncio
 import typing as t
 import time
 import re
+import functools
 import pyarrow as pa
 from pypika import Field as Field, Order
 from pypika.analytics import RowNumber
@@ -332,6 +333,21 @@ def duckdb_to_pyarrow_type(duckdb_type: str):
     raise ValueError(f"Unsupported DuckDB type: {duckdb_type}")
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cached(sql: str, dialect: t.Optional[str] = None) -> Expression:
+    return parse_one(sql, read=dialect)
+
+
+def parse_sql(sql: str, dialect: t.Optional[str] = None) -> Expression:
+    """
+    Parses SQL into a sqlglot expression, reusing the parse of
+    previously seen strings.
+
+    Returns a copy, so callers may mutate the tree freely.
+    """
+    return _parse_cached(sql, dialect).copy()
+
+
 # TODO: Split into separate QueryRenderer class
 def build_ranked_query(
     query: str,
@@ -356,11 +372,11 @@ def build_ranked_query(
     apply_ranking = bool(version and keys)
     where_clause = f"WHERE {Field('__rank__') == 1}" if apply_ranking else ""
 
-    base_query = parse_one(query)
+    base_query = parse_sql(query)
 
     if apply_ranking:
         rank_filter_expr = Field("__rank__") == 1
-        parsed_filter = parse_one(str(rank_filter_expr))
+        parsed_filter = _parse_cached(str(rank_filter_expr))
         where_clause = f"WHERE {parsed_filter.sql(dialect, identify=True)}"
         base_query = base_query.from_(selectable)  # type: ignore[attr-defined]
         # Build ROW_NUMBER() OVER (PARTITION BY ...) ORDER BY ... using PyPika
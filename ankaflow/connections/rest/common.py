@@ -2,10 +2,17 @@
 # TODO fix pylance warnings
 import typing as t
 from urllib.parse import urljoin
-from io import StringIO, FileIO
+from io import BytesIO, StringIO, FileIO
 import logging
 import json
-from pathlib import Path
+import os
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 from ... import models as m
 from ...models import enums as enums
@@ -42,6 +49,14 @@ class Materializer:
     into DuckDB table from multiple batches.
     """
 
+    # DataType -> DDB reader method
+    _READERS: t.Dict[enums.DataType, str] = {
+        enums.DataType.JSONL: "read_json",
+        enums.DataType.JSON: "read_json",
+        enums.DataType.CSV: "read_csv",
+        enums.DataType.PARQUET: "read_parquet",
+    }
+
     def __init__(
         self,
         connection: internal.DDB,
@@ -53,19 +68,32 @@ class Materializer:
     ):
         self.dtype = dtype
         self.connection = connection
+        self._cols_map: t.Optional[dict[str, str]] = None
         self.fields = columns
         self.schema = schema
         self.table = table
         self.log = logger or logging.getLogger(__name__)
 
+    @property
+    def fields(self) -> t.Optional[t.List[m.Column]]:
+        return self._fields
+
+    @fields.setter
+    def fields(self, columns: t.Optional[t.List[m.Column]]):
+        self._fields = columns
+        self._cols_map = None
+
     def cols_to_map(self) -> dict[str, str]:
         """
         Converts field list into format required by duckdb.read_x().
+        The mapping is built once and reused until `fields` is reassigned.
 
         Returns:
             dict[str, str]: {"col_name": "data_type"}
         """
-        return {it.name: it.type for it in self.fields}
+        if self._cols_map is None:
+            self._cols_map = {it.name: it.type for it in self.fields}
+        return self._cols_map
 
     async def create_table(self):
         """
@@ -99,18 +127,25 @@ class Materializer:
 
     async def _prepare_buffer(self, data, filename):
         """
-        Prepare a buffer (StringIO or FileIO) from the input data or file.
+        Prepare a buffer (StringIO, BytesIO or FileIO) from the input data
+        or file. Lists and dicts are serialized with orjson when installed.
         """
+        # Already serialized: wrap as-is, no parse/dump round trip
+        if isinstance(data, str):
+            return StringIO(data)
         if data is not None:
-            if isinstance(data, (list, dict)):
-                string = json.dumps(data if isinstance(data, list) else [data])
-            elif isinstance(data, str):
-                string = data
-            else:
+            if not isinstance(data, (list, dict)):
                 raise ValueError(
                     "Cannot infer type: can be JSON string, list, or dict"
                 )  # noqa:E501
-            return StringIO(string)
+            payload = data if isinstance(data, list) else [data]
+            if _HAS_ORJSON:
+                try:
+                    return BytesIO(orjson.dumps(payload))
+                except orjson.JSONEncodeError:
+                    # e.g. integers beyond 64 bits; let stdlib decide
+                    pass
+            return StringIO(json.dumps(payload))
         elif filename:
             try:
                 return FileIO(filename, "r")
@@ -120,22 +155,18 @@ class Materializer:
         else:
             raise ValueError("Either data or filename must be provided")
 
-    async def _insert_data(self, buffer: t.Union[StringIO, FileIO]):
+    async def _insert_data(self, buffer: t.Union[StringIO, BytesIO, FileIO]):
         """
         Insert data from a buffer into the database.
         """
         read_opts = {"columns": self.cols_to_map()} if self.fields else {}
         try:
-            if self.dtype in [enums.DataType.JSONL, enums.DataType.JSON]:
-                await self.connection.read_json(buffer, self.table, read_opts)
-            elif self.dtype == enums.DataType.CSV:
-                await self.connection.read_csv(buffer, self.table, read_opts)
-            elif self.dtype == enums.DataType.PARQUET:
-                await self.connection.read_parquet(
-                    buffer, self.table, read_opts
-                )
-            else:
+            reader = self._READERS.get(self.dtype)
+            if reader is None:
                 raise MaterializeError(f"Unsupported data type: {self.dtype}")
+            await getattr(self.connection, reader)(
+                buffer, self.table, read_opts
+            )
         except MaterializeError:
             raise
         except Exception as e:
@@ -150,7 +181,7 @@ class Materializer:
         Clean up (delete) a file after processing.
         """
         try:
-            Path(filename).unlink()
+            os.unlink(filename)
         except Exception as e:
             log.warning(f"Failed to delete file {filename}: {e}")
 
@@ -3,7 +3,7 @@ import typing as t
 import duckdb
 from pandas import DataFrame
 from pyarrow import Table
-from io import StringIO, FileIO
+from io import BytesIO, StringIO, FileIO
 import sys
 from duckdb import DuckDBPyRelation  # noqa:E501
 
@@ -96,19 +96,19 @@ class DDB(ABC):
 
     @abstractmethod
     async def read_json(
-        self, data: t.Union[FileIO, StringIO], table: str, read_opts: t.Dict
+        self, data: t.Union[FileIO, StringIO, BytesIO], table: str, read_opts: t.Dict
     ):
         pass
 
     @abstractmethod
     async def read_parquet(
-        self, data: t.Union[FileIO, StringIO], table: str, read_opts: t.Dict
+        self, data: t.Union[FileIO, StringIO, BytesIO], table: str, read_opts: t.Dict
     ):
         pass
 
     @abstractmethod
     async def read_csv(
-        self, data: t.Union[FileIO, StringIO], table: str, read_opts: t.Dict
+        self, data: t.Union[FileIO, StringIO, BytesIO], table: str, read_opts: t.Dict
     ):
         pass
 
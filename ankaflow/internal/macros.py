@@ -40,24 +40,14 @@ def register_macro(name: str, definition: str) -> None:
     Raises:
         ValueError: If the given name conflicts with a built-in macro.
     """
-    builtins = {
-        k: getattr(Fn, k)
-        for k in Fn.__dict__.keys()
-        if not k.startswith("__")
-    }
-    if name in builtins:
+    if name in _builtin_macros:
         raise ValueError(f"Macro '{name}' already exists.")
     body = definition.strip().rstrip(";")
     _registered_macros[name] = body
 
 def iter_macros() -> t.Dict[str, str]:
     """Return all macros (built-in + dynamic)."""
-    builtins = {
-        k: getattr(Fn, k)
-        for k in Fn.__dict__.keys()
-        if not k.startswith("__")
-    }
-    return {**builtins, **_registered_macros}
+    return {**_builtin_macros, **_registered_macros}
 
 class Fn:
     """
@@ -319,3 +309,9 @@ class Fn:
         END
     )
     """
+
+
+# Built-in macro bodies keyed by name, collected once at import time
+_builtin_macros: t.Dict[str, str] = {
+    k: v for k, v in vars(Fn).items() if not k.startswith("_")
+}
@@ -1,7 +1,7 @@
 import duckdb
 import os
 from pyarrow import Table
-from io import FileIO, StringIO
+from io import BytesIO, FileIO, StringIO
 import typing as t
 import logging
 import random
@@ -194,7 +194,7 @@ class DDB:
 
     async def read_json(
         self,
-        data: t.Union[FileIO, StringIO],
+        data: t.Union[FileIO, StringIO, BytesIO],
         table: str,
         read_opts: t.Dict,
         create_when_needed: bool = True,
@@ -211,7 +211,7 @@ class DDB:
 
     async def read_csv(
         self,
-        data: t.Union[FileIO, StringIO],
+        data: t.Union[FileIO, StringIO, BytesIO],
         table: str,
         read_opts: t.Dict,
         create_when_needed: bool = True,
@@ -229,7 +229,7 @@ class DDB:
 
     async def read_parquet(
         self,
-        data: t.Union[FileIO, StringIO],
+        data: t.Union[FileIO, StringIO, BytesIO],
         table: str,
         read_opts: t.Dict,
         create_when_needed: bool = True,
@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+# Only used when the suite is run under pytest; `python -m unittest` ignores
+# this file. Test modules keep their shared state (DuckDB connections, event
+# loops) at module or class level, which pytest-xdist gives each worker
+# process its own copy of, so `pytest -n auto ankaflow/tests` is safe.
+
+
+# optionalhook: plain pytest without xdist would reject an unknown hook
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # The suite is small: past a few workers, process start-up dominates.
+    return min(os.cpu_count() or 1, 4)
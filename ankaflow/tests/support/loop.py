@@ -0,0 +1,59 @@
+import asyncio
+import typing as t
+
+try:
+    import uvloop  # type: ignore
+
+    LOOP_FACTORY: t.Optional[t.Callable[[], asyncio.AbstractEventLoop]] = (
+        uvloop.new_event_loop
+    )
+except ImportError:
+    LOOP_FACTORY = None
+
+
+class SharedLoopMixin:
+    """
+    Runs every async test of a ``IsolatedAsyncioTestCase`` subclass on
+    one event loop instead of creating and closing a loop per test.
+
+    Uses uvloop when it is installed, otherwise the default loop.
+    Only mix into test cases whose tests share no loop-bound state.
+
+    Relies on the private ``_setupAsyncioRunner`` /
+    ``_tearDownAsyncioRunner`` hooks of ``IsolatedAsyncioTestCase``
+    (CPython 3.11+); revisit if unittest changes them.
+    """
+
+    def _setupAsyncioRunner(self):
+        cls = type(self)
+        runner = cls.__dict__.get("_shared_runner")
+        if runner is None:
+            runner = asyncio.Runner(debug=True, loop_factory=LOOP_FACTORY)
+            cls._shared_runner = runner
+        self._asyncioRunner = runner
+
+    def _tearDownAsyncioRunner(self):
+        # The runner is closed once in tearDownClass, but tasks a test left
+        # behind are cancelled now, as closing a per-test runner would do,
+        # so they cannot run on into the next test. Dropping the reference
+        # keeps IsolatedAsyncioTestCase.__del__ from tearing down again.
+        runner, self._asyncioRunner = self._asyncioRunner, None
+        if runner is None:
+            return
+        loop = runner.get_loop()
+        pending = asyncio.all_tasks(loop)
+        if not pending:
+            return
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(
+            asyncio.gather(*pending, return_exceptions=True)
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()  # type: ignore[misc]
+        runner = cls.__dict__.get("_shared_runner")
+        if runner is not None:
+            runner.close()
+            cls._shared_runner = None
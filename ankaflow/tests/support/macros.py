@@ -0,0 +1,22 @@
+import typing as t
+
+import duckdb
+
+
+def macro_script(macros: t.Mapping[str, str]) -> str:
+    """
+    Renders the Fn schema and ``CREATE OR REPLACE MACRO`` statements for
+    ``macros`` as one script, the same statements the engines run at
+    connection set-up. Safe to execute repeatedly.
+    """
+    return "CREATE SCHEMA IF NOT EXISTS Fn;\n" + "\n".join(
+        f"CREATE OR REPLACE MACRO Fn.{name}{body};"
+        for name, body in macros.items()
+    )
+
+
+def build_fn_con(macros: t.Mapping[str, str]) -> duckdb.DuckDBPyConnection:
+    # One script, one execute: avoids a parse/plan round trip per macro
+    con = duckdb.connect(database=":memory:")
+    con.execute(macro_script(macros))
+    return con
@@ -1,14 +1,41 @@
 # type: ignore
+import os
 import unittest
 import tempfile
 from io import StringIO, FileIO
 
-from ..common.filesystem import LocalFileSystem, FileSystem
+from ..common.filesystem import LocalFileSystem, FileSystem, _compile_glob
+from .support.loop import SharedLoopMixin
+
+
+def _tmpfs_root():
+    """Prefer a RAM-backed directory for scratch files, if one is writable."""
+    for candidate in ("/dev/shm", os.environ.get("XDG_RUNTIME_DIR")):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
+TMP_ROOT = _tmpfs_root()
+
+TXT = "text/plain"
+BIN = "application/octet-stream"
+
+SAMPLE_FILES = (
+    ("file1.txt", "Content 1", TXT),
+    ("file2.txt", "Content 2", TXT),
+    ("file3.bin", b"Data", BIN),
+)
+ASYNC_SAMPLE_FILES = (
+    ("async_file1.txt", "Content A", TXT),
+    ("async_file2.txt", "Content B", TXT),
+    ("async_file3.bin", b"Data", BIN),
+)
 
 
 class TestLocalFileSystem(unittest.TestCase):
     def setUp(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=TMP_ROOT)
         self.fs = LocalFileSystem(self.temp_dir.name)
 
     def tearDown(self):
@@ -55,17 +82,7 @@ class TestLocalFileSystem(unittest.TestCase):
         fio.close()
 
     def test_list_files(self):
-        files = {
-            "file1.txt": "Content 1",
-            "file2.txt": "Content 2",
-            "file3.bin": b"Data",
-        }
-        for fname, content in files.items():
-            mime = (
-                "text/plain"
-                if isinstance(content, str)
-                else "application/octet-stream"
-            )
+        for fname, content, mime in SAMPLE_FILES:
             self.fs.save_file(fname, content, mime)
         listed_files = self.fs.list_files("*.txt")
         self.assertEqual(len(listed_files), 2)
@@ -73,6 +90,35 @@ class TestLocalFileSystem(unittest.TestCase):
         self.assertIn("file1.txt", names)
         self.assertIn("file2.txt", names)
 
+    def test_list_files_reuses_compiled_pattern(self):
+        for fname, content, mime in SAMPLE_FILES:
+            self.fs.save_file(fname, content, mime)
+        self.fs.list_files("*.txt")
+        hits = _compile_glob.cache_info().hits
+        listed_files = self.fs.list_files("*.txt")
+        self.assertEqual(len(listed_files), 2)
+        self.assertEqual(_compile_glob.cache_info().hits, hits + 1)
+
+    def test_list_files_nested_pattern(self):
+        self.fs.save_file("sub/nested.txt", "Nested", TXT)
+        self.fs.save_file("top.txt", "Top", TXT)
+        self.assertEqual(
+            [f["name"] for f in self.fs.list_files("sub/*.txt")],
+            ["sub/nested.txt"],
+        )
+        # Flat patterns do not descend into subdirectories
+        self.assertEqual(
+            [f["name"] for f in self.fs.list_files("*")], ["top.txt"]
+        )
+
+    def test_list_files_missing_root(self):
+        self.fs.save_file("gone.txt", "Gone", TXT)
+        self.temp_dir.cleanup()
+        for pattern in ("*", "sub/*.txt"):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(self.fs.list_files(pattern), [])
+                self.assertEqual(self.fs.delete_files(pattern), 0)
+
     def test_delete_file(self):
         filename = "delete_me.txt"
         content = "Delete me!"
@@ -82,17 +128,7 @@ class TestLocalFileSystem(unittest.TestCase):
         self.assertFalse(self.fs.delete_file(filename))
 
     def test_delete_files(self):
-        files = {
-            "file1.txt": "Content 1",
-            "file2.txt": "Content 2",
-            "file3.bin": b"Data",
-        }
-        for fname, content in files.items():
-            mime = (
-                "text/plain"
-                if isinstance(content, str)
-                else "application/octet-stream"
-            )
+        for fname, content, mime in SAMPLE_FILES:
             self.fs.save_file(fname, content, mime)
         count = self.fs.delete_files("*.txt")
         self.assertEqual(count, 2)
@@ -101,9 +137,9 @@ class TestLocalFileSystem(unittest.TestCase):
         self.assertEqual(remaining[0]["name"], "file3.bin")
 
 
-class TestFileSystem(unittest.IsolatedAsyncioTestCase):
+class TestFileSystem(SharedLoopMixin, unittest.IsolatedAsyncioTestCase):
     def setUp(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=TMP_ROOT)
         # Ensure local behavior for testing.
         global IS_PYODIDE
         IS_PYODIDE = False
@@ -154,18 +190,7 @@ class TestFileSystem(unittest.IsolatedAsyncioTestCase):
         fio.close()
 
     async def test_list_files(self):
-        files = {
-            "async_file1.txt": "Content A",
-            "async_file2.txt": "Content B",
-            "async_file3.bin": b"Data",
-        }
-        for fname, content in files.items():
-            mime = (
-                "text/plain"
-                if isinstance(content, str)
-                else "application/octet-stream"
-            )
-            await self.fs.save_file(fname, content, mime)
+        await self.fs.save_files(ASYNC_SAMPLE_FILES)
         listed_files = await self.fs.list_files("*.txt")
         self.assertEqual(len(listed_files), 2)
         names = [f["name"] for f in listed_files]
@@ -180,18 +205,7 @@ class TestFileSystem(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(await self.fs.delete_file(filename))
 
     async def test_delete_files(self):
-        files = {
-            "async_file1.txt": "Content A",
-            "async_file2.txt": "Content B",
-            "async_file3.bin": b"Data",
-        }
-        for fname, content in files.items():
-            mime = (
-                "text/plain"
-                if isinstance(content, str)
-                else "application/octet-stream"
-            )
-            await self.fs.save_file(fname, content, mime)
+        await self.fs.save_files(ASYNC_SAMPLE_FILES)
         count = await self.fs.delete_files("*.txt")
         self.assertEqual(count, 2)
         remaining = await self.fs.list_files("*")
@@ -2,19 +2,34 @@
 import unittest
 import duckdb
 import typing as t
-from datetime import datetime, timezone
+from datetime import datetime
 
-from ..internal.macros import Fn
+from ..internal.macros import _builtin_macros
+from .support.macros import build_fn_con
+
+# Fn.dt() inputs (ns, ms, s, fractional s) and expected naive UTC values
+DT_NUMERIC_CASES = (
+    (1712361600000000000, datetime(2024, 4, 6)),
+    (1712361600000, datetime(2024, 4, 6)),
+    (1712361600, datetime(2024, 4, 6)),
+    (1712361600.5, datetime(2024, 4, 6, 0, 0, 0, 500000)),
+    (1712361600.255, datetime(2024, 4, 6, 0, 0, 0, 255000)),
+)
+DT_ISO = datetime(2025, 3, 10, 17, 24, 41)
+DT_EPOCH = datetime(1970, 1, 1)
+
+# Read-only for this module's tests; hand out cursors, not new connections
+FN_CON = build_fn_con(_builtin_macros)
 
 
 class TestFnMacros(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.con = duckdb.connect(database=":memory:")
-        cls.con.execute("CREATE SCHEMA Fn;")
-        for fn_name in [k for k in Fn.__dict__ if not k.startswith("__")]:
-            macro_def = f"CREATE MACRO Fn.{fn_name}" + getattr(Fn, fn_name)
-            cls.con.execute(macro_def)
+        cls.con = FN_CON.cursor()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.con.close()
 
     def assertFn(self, sql, expected, caster=None):
         rel = self.con.execute(sql)
@@ -124,43 +139,19 @@ class TestFnMacros(unittest.TestCase):
         self.assertFn("SELECT Fn.dt_monday(TIMESTAMP '2024-04-17')", datetime.fromisoformat("2024-04-15T00:00:00"))
 
     def test_dt_macro(self):
-        # timestamp in nanoseconds
-        value_ns = 1712361600000000000  # nanoseconds for 2024-04-06T00:00:00
-        expected = datetime.fromtimestamp(value_ns / 1_000_000_000, timezone.utc).replace(tzinfo=None)
-        query = f"SELECT Fn.dt({value_ns})"
-        self.assertFn(query, expected)
-
-        # unix milliseconds
-        value_ms = 1712361600000
-        expected = datetime.fromtimestamp(value_ms / 1_000, timezone.utc).replace(tzinfo=None)
-        query = f"SELECT Fn.dt({value_ms})"
-        self.assertFn(query, expected)
-
-        # unix seconds
-        value_s = 1712361600
-        expected = datetime.fromtimestamp(value_s, timezone.utc).replace(tzinfo=None)
-        query = f"SELECT Fn.dt({value_s})"
-        self.assertFn(query, expected)
-        # unix seconds with fractions
-        value_s = 1712361600.5
-        expected = datetime.fromtimestamp(value_s, timezone.utc).replace(tzinfo=None)
-        query = f"SELECT Fn.dt({value_s})"
-        self.assertFn(query, expected)
-        value_s = 1712361600.255
-        expected = datetime.fromtimestamp(value_s, timezone.utc).replace(tzinfo=None)
-        query = f"SELECT Fn.dt({value_s})"
-        self.assertFn(query, expected)
+        for value, expected in DT_NUMERIC_CASES:
+            self.assertFn(f"SELECT Fn.dt({value})", expected)
 
         # iso string that can be directly cast
-        self.assertFn("SELECT Fn.dt('2025-03-10 17:24:41')", datetime.fromisoformat("2025-03-10T17:24:41"))
-        self.assertFn("SELECT Fn.dt(concat('2025-03-10',' ','17:24:41'))", datetime.fromisoformat("2025-03-10T17:24:41"))
+        self.assertFn("SELECT Fn.dt('2025-03-10 17:24:41')", DT_ISO)
+        self.assertFn("SELECT Fn.dt(concat('2025-03-10',' ','17:24:41'))", DT_ISO)
         # unknown string fallback to 1970
-        self.assertFn("SELECT Fn.dt('not a date')", datetime.fromisoformat("1970-01-01T00:00:00"))
+        self.assertFn("SELECT Fn.dt('not a date')", DT_EPOCH)
         with self.assertRaises(duckdb.ConversionException):
-            self.assertFn("SELECT Fn.dt('not a date', fail_on_error:=TRUE)", datetime.fromisoformat("1970-01-01T00:00:00"))
+            self.assertFn("SELECT Fn.dt('not a date', fail_on_error:=TRUE)", DT_EPOCH)
 
         # iso string that can be formatted
-        self.assertFn("SELECT Fn.dt('2024/04/06', '%Y/%m/%d')", datetime.fromisoformat("2024-04-06T00:00:00"))
+        self.assertFn("SELECT Fn.dt('2024/04/06', '%Y/%m/%d')", datetime(2024, 4, 6))
 
     def test_dt_isoformat(self):
         self.assertFn("SELECT Fn.dt_isoformat(TIMESTAMP '2024-04-01 00:00:00')", "2024-04-01 00:00:00")
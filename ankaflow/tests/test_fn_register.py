@@ -4,6 +4,7 @@ import duckdb
 import typing as t
 
 from ..internal.macros import Fn, register_macro, iter_macros, _registered_macros
+from .support.macros import macro_script
 
 class TestRegisterMacros(unittest.TestCase):
 
@@ -11,14 +12,16 @@ class TestRegisterMacros(unittest.TestCase):
     def setUpClass(cls) -> None:
         cls.con = duckdb.connect(database=":memory:")
 
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.con.close()
+
     # def tearDown(self) -> None:
     #     self.con.close()
 
     def init_all(self):
-        self.con.execute("CREATE SCHEMA Fn;")
-        for name, body in iter_macros().items():
-            macro = f"""CREATE OR REPLACE MACRO Fn.{name}{body};"""
-            self.con.execute(macro)
+        # Same path as the engines: everything iter_macros() yields
+        self.con.execute(macro_script(iter_macros()))
 
     def test_register_macro(self):
         register_macro("answer", "() AS 42;")
@@ -36,6 +36,11 @@ class FakeBackend:
         self.temperature = temperature
 
 
+# Shared, never-mutated protocol and config instances
+MOCK_PROTO = t.cast(LLMProtocol, MockProtocol())
+MOCK_LLM_CONFIG = t.cast(llm.LLMConfig, FakeBackend(kind=FakeKind.MOCK))
+
+
 class FakeProxy:
     def __init__(self):
         self.client = MagicMock()
@@ -68,10 +73,9 @@ class TestParseModelResponse(unittest.TestCase):
 
 class TestMockProtocol(unittest.TestCase):
     def test_format_and_parse(self):
-        proto = MockProtocol()
-        result = proto.format("test", {"a": 1})
+        result = MOCK_PROTO.format("test", {"a": 1})
         self.assertIn("model", result)
-        parsed = proto.parse({"query": "SELECT 1;", "message": "hi"})
+        parsed = MOCK_PROTO.parse({"query": "SELECT 1;", "message": "hi"})
         self.assertEqual(parsed.query, "SELECT 1;")
 
 
@@ -92,20 +96,22 @@ class TestOpenAIProtocol(unittest.TestCase):
 
 
 class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # MockClient is stateless across fetches; share one instance
+        cls.mock_client = MockClient(protocol=MOCK_PROTO)
+
     async def test_mock_client_response(self):
-        client = MockClient(protocol=t.cast(LLMProtocol, MockProtocol()))
-        resp = await client.fetch("some prompt")
+        resp = await self.mock_client.fetch("some prompt")
         self.assertIn("query", resp)
 
     async def test_mock_client_error(self):
-        client = MockClient(protocol=t.cast(LLMProtocol, MockProtocol()))
         with self.assertRaises(FetchError):
-            await client.fetch("ERROR trigger")
+            await self.mock_client.fetch("ERROR trigger")
 
     async def test_mock_client_json_echo(self):
-        client = MockClient(protocol=t.cast(LLMProtocol, MockProtocol()))
         raw = {"query": "SELECT 9;"}
-        result = await client.fetch(json.dumps(raw))
+        result = await self.mock_client.fetch(json.dumps(raw))
         self.assertEqual(result["query"], "SELECT 9;")
 
     async def test_proxy_client(self):
@@ -127,7 +133,7 @@ class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
             lambda deep=False: real_request
         )  # return the valid request
         client = ProxyClient(
-            protocol=t.cast(LLMProtocol, MockProtocol()),
+            protocol=MOCK_PROTO,
             proxy=t.cast(llm.LLMProxy, proxy),
         )
         # Patch the _client.fetch (RestApi.fetch), not the top-level fetch()
@@ -141,9 +147,7 @@ class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(result, dict)
 
     async def test_openai_client(self):
-        client = OpenAIClient(
-            protocol=t.cast(LLMProtocol, MockProtocol()), logger=None
-        )
+        client = OpenAIClient(protocol=MOCK_PROTO, logger=None)
         client._client.fetch = AsyncMock(return_value=None)
         result = await client.fetch("prompt")
         self.assertIsInstance(result, dict)
@@ -159,9 +163,7 @@ class TestFactories(unittest.TestCase):
         self.assertIsInstance(proto, OpenAIProtocol)
 
     def test_make_protocol_mock(self):
-        proto = make_protocol(
-            t.cast(llm.LLMConfig, FakeBackend(kind=FakeKind.MOCK))
-        )
+        proto = make_protocol(MOCK_LLM_CONFIG)
         self.assertIsInstance(proto, MockProtocol)
 
     def test_make_protocol_invalid(self):
@@ -169,8 +171,7 @@ class TestFactories(unittest.TestCase):
             make_protocol(t.cast(llm.LLMConfig, FakeBackend(kind="other")))
 
     def test_make_client_mock(self):
-        proto = MockProtocol()
-        client = make_client(t.cast(LLMProtocol, proto))
+        client = make_client(MOCK_PROTO)
         self.assertIsInstance(client, MockClient)
 
 
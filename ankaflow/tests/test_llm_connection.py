@@ -10,13 +10,18 @@ from ..connections.llm.sqlgen import (
     REPLAYABLE_SQL_ERRORS
 )
 
-from ..connections.llm.protocols import LLMResponse
-
-
-class TestLLMConnectionReplay(unittest.IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
-        self.vars = {}
-        self.conn = SQLGenConnection(
+from ..connections.llm.protocols import LLMProtocol, LLMResponse
+from .support.loop import SharedLoopMixin
+
+
+class TestLLMConnectionReplay(
+    SharedLoopMixin, unittest.IsolatedAsyncioTestCase
+):
+    @classmethod
+    def setUpClass(cls):
+        # Connection config and collaborator mocks are not mutated by the
+        # tests, so build them once and reset between tests.
+        cls.conn = SQLGenConnection(
             kind="SQLGen",
             variables={"var": "value"},
             config=ConnectionConfiguration(
@@ -26,14 +31,26 @@ class TestLLMConnectionReplay(unittest.IsolatedAsyncioTestCase):
             )
         )
         )
-        self.duck = MagicMock()
+        cls.duck = MagicMock()
+        cls.context = MagicMock()
+        cls.logger = MagicMock()
+        cls.mock_proto = MagicMock(spec=LLMProtocol)
+
+    async def asyncSetUp(self):
+        self.vars = {}
+        for mock in (self.duck, self.context, self.logger):
+            mock.reset_mock()
+        self.mock_proto.reset_mock()
+        for method in (self.mock_proto.format, self.mock_proto.parse):
+            method.reset_mock(return_value=True, side_effect=True)
+        self.mock_proto.kind = "mock"
         self.llm = SQLGen(
             duck=self.duck,
             name="Test",
             connection=self.conn, # type: ignore
-            context=MagicMock(),
+            context=self.context,
             variables=self.vars, # type: ignore - Varibales is just wrapper around dict 
-            logger=MagicMock(),
+            logger=self.logger,
         )
         self.llm.init()
         self.llm._prompt = "SELECT * FROM test;"
@@ -44,11 +61,9 @@ class TestLLMConnectionReplay(unittest.IsolatedAsyncioTestCase):
         response1 = LLMResponse(query="SELECT * FROM error;", message="Bad")
         response2 = LLMResponse(query="SELECT * FROM good;", message="Ok")
 
-        mock_proto = MagicMock()
-        mock_proto.kind = "mock"
-        mock_proto.format = MagicMock(return_value={})
-        mock_proto.parse = MagicMock(side_effect=[response1, response2])
-        self.llm.protocol = mock_proto
+        self.mock_proto.format.return_value = {}
+        self.mock_proto.parse.side_effect = [response1, response2]
+        self.llm.protocol = self.mock_proto
 
         self.llm.client.fetch = AsyncMock(
             side_effect=[{"query": "SELECT *", "message": "retrying"}]
@@ -68,10 +83,8 @@ class TestLLMConnectionReplay(unittest.IsolatedAsyncioTestCase):
         response = LLMResponse(query="SELECT * FROM table;", message="msg")
 
         # Use a mock protocol that always returns the same response
-        mock_proto = MagicMock()
-        mock_proto.kind = "mock"
-        mock_proto.parse = MagicMock(return_value=response)
-        self.llm.protocol = mock_proto
+        self.mock_proto.parse.return_value = response
+        self.llm.protocol = self.mock_proto
 
         # Simulate repeated replayable errors on execution
         self.llm.client.fetch = AsyncMock(
@@ -1,24 +1,63 @@
+import os
 import unittest
 import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
-from io import StringIO, FileIO
+from io import BytesIO, StringIO, FileIO
+import json
 from pathlib import Path
-import logging
 
 from ..connections.rest import common
 from ..models import enums
 from .. import models as m
 
+SAMPLE_JSON = b'[{"col1": "value1"}]'
+
+
+class RecLogger:
+    """Records logger calls without spec'ing the whole Logger class."""
+
+    def __init__(self):
+        self.debug = MagicMock()
+        self.info = MagicMock()
+        self.warning = MagicMock()
+        self.error = MagicMock()
+        self.exception = MagicMock()
+
+
 class TestMaterializer(unittest.IsolatedAsyncioTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # One scratch file for the whole class; tests that consume it
+        # (materialize deletes its input) rewrite it via _refresh_tmp()
+        fd, cls._tmpname = tempfile.mkstemp()
+        os.write(fd, SAMPLE_JSON)
+        os.close(fd)
+        cls.mock_connection = AsyncMock()
+        cls.mock_schema = MagicMock(spec=common.Schema)
+        cls.mock_schema.generate.return_value = "CREATE TABLE test_table ..."
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            os.unlink(cls._tmpname)
+        except FileNotFoundError:
+            pass
+
+    def _refresh_tmp(self):
+        with open(self._tmpname, "wb") as f:
+            f.write(SAMPLE_JSON)
+        return self._tmpname
+
     async def asyncSetUp(self):
         patcher = patch(f"{__name__}.common.log.warning")
         self.mock_warning = patcher.start()
         self.addCleanup(patcher.stop)
-        self.mock_connection = AsyncMock()
-        self.mock_schema = MagicMock(spec=common.Schema)
-        self.mock_schema.generate.return_value = "CREATE TABLE test_table ..."
-        self.mock_logger = MagicMock(spec=logging.Logger)
+        # Mocks are built once per class; only call history and side
+        # effects need clearing between tests.
+        for mock in (self.mock_connection, self.mock_schema):
+            mock.reset_mock(side_effect=True)
+        self.mock_logger = RecLogger()
         self.materializer = common.Materializer(
             self.mock_connection,
             enums.DataType.JSONL,
@@ -45,17 +84,23 @@ class TestMaterializer(unittest.IsolatedAsyncioTestCase):
         actual_map = self.materializer.cols_to_map()
         self.assertEqual(actual_map, expected_map)
 
+    def test_cols_to_map_reset_on_fields_change(self):
+        self.assertIs(self.materializer.cols_to_map(),
+                      self.materializer.cols_to_map())
+        self.materializer.fields = [m.Column(name="col2", type="INTEGER")]
+        self.assertEqual(self.materializer.cols_to_map(), {"col2": "INTEGER"})
+
     async def test__prepare_buffer_data_list(self):
         data = [{"col1": "value1"}]
         buffer = await self.materializer._prepare_buffer(data, None)
-        self.assertIsInstance(buffer, StringIO)
-        self.assertEqual(buffer.getvalue(), '[{"col1": "value1"}]') # type: ignore
+        self.assertIsInstance(buffer, (StringIO, BytesIO))
+        self.assertEqual(json.loads(buffer.getvalue()), [{"col1": "value1"}]) # type: ignore
 
     async def test__prepare_buffer_data_dict(self):
         data = {"col1": "value1"}
         buffer = await self.materializer._prepare_buffer(data, None)
-        self.assertIsInstance(buffer, StringIO)
-        self.assertEqual(buffer.getvalue(), '[{"col1": "value1"}]') # type: ignore
+        self.assertIsInstance(buffer, (StringIO, BytesIO))
+        self.assertEqual(json.loads(buffer.getvalue()), [{"col1": "value1"}]) # type: ignore
 
     async def test__prepare_buffer_data_string(self):
         data = '[{"col1": "value1"}]'
@@ -64,15 +109,18 @@ class TestMaterializer(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(buffer.getvalue(), '[{"col1": "value1"}]') # type: ignore
 
     async def test__prepare_buffer_file(self):
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp_file:
-            tmp_file.write('[{"col1": "value1"}]')
-            filename = tmp_file.name
+        filename = self._refresh_tmp()
 
         buffer = await self.materializer._prepare_buffer(None, filename)  # Pass file
         self.assertIsInstance(buffer, FileIO)
         self.assertEqual(buffer.name, filename)
         buffer.close()
-        Path(filename).unlink()
+
+    async def test__prepare_buffer_stdlib_fallback(self):
+        with patch(f"{__name__}.common._HAS_ORJSON", False):
+            buffer = await self.materializer._prepare_buffer({"col1": 1}, None)
+        self.assertIsInstance(buffer, StringIO)
+        self.assertEqual(buffer.getvalue(), '[{"col1": 1}]') # type: ignore
 
     async def test__prepare_buffer_no_data_or_file(self):
         with self.assertRaises(ValueError):
@@ -119,7 +167,7 @@ class TestMaterializer(unittest.IsolatedAsyncioTestCase):
         filename = "test_file.txt"
         # Patch the module-level logger (log) used in _cleanup_file
         with patch(f"{__name__}.common.log.warning") as mock_warning:
-            with patch("pathlib.Path.unlink") as mock_unlink:
+            with patch(f"{__name__}.common.os.unlink") as mock_unlink:
                 mock_unlink.side_effect = Exception("Deletion error")
                 self.materializer._cleanup_file(filename)
                 mock_warning.assert_called_once()
@@ -130,9 +178,7 @@ class TestMaterializer(unittest.IsolatedAsyncioTestCase):
         self.mock_connection.read_json.assert_called_once()
 
     async def test_materialize_file(self):
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp_file:
-            tmp_file.write('[{"col1": "value1"}]')
-            filename = tmp_file.name
+        filename = self._refresh_tmp()
 
         await self.materializer.materialize(None, filename=filename) # type: ignore
 
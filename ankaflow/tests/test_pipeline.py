@@ -2,6 +2,8 @@ import unittest
 import pandas as pd
 import typing as t
 import logging
+import re
+from types import SimpleNamespace
 from pydantic import BaseModel, RootModel
 from enum import Enum
 
@@ -23,6 +25,12 @@ class ConnectionConfiguration(BaseModel):
     pass
 
 
+TAG_RE = re.compile(r"<<\s*(.+?)\s*>>")
+TAG_LOOKUPS: t.Dict[str, t.Callable[[dict], t.Any]] = {
+    "variables['loop_control']['id']": lambda v: v["loop_control"]["id"],
+}
+
+
 class DummyRenderer:
     def __init__(self, context: t.Any, API: t.Any, variables: dict) -> None:
         self.context = context
@@ -30,28 +38,37 @@ class DummyRenderer:
         self.variables = variables
 
     def render(self, templ: t.Any) -> t.Any:
-        if isinstance(templ, str) and "<<" in templ and ">>" in templ:
+        if not isinstance(templ, str):
+            return templ
+
+        def substitute(match: re.Match) -> str:
+            lookup = TAG_LOOKUPS.get(match.group(1))
+            if lookup is None:
+                return match.group(0)
             try:
-                val = self.variables["loop_control"]["id"]
-                return templ.replace(
-                    "<< variables['loop_control']['id'] >>", str(val)
-                )
+                return str(lookup(self.variables))
             except Exception:
-                return templ
-        return templ
+                return match.group(0)
+
+        return TAG_RE.sub(substitute, templ)
 
 
 class DummyAPI:
     pass
 
 
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+LOGGER.propagate = False
+
+# Built once and shared; never mutate these frames
+DEFAULT_DF = pd.DataFrame([{"id": 1, "value": "dummy"}])
+FLOW_DF = pd.DataFrame([{"id": 1, "val": "value"}])
+
+
 class DummyResult:
     def __init__(self, data: t.Optional[pd.DataFrame] = None) -> None:
-        self._data = (
-            pd.DataFrame([{"id": 1, "value": "dummy"}])
-            if data is None
-            else data
-        )
+        self._data = DEFAULT_DF if data is None else data
 
     async def df(self) -> pd.DataFrame:
         return self._data
@@ -146,6 +163,7 @@ class Datablock:
         variables,
         logger,
         prevous_stage=None,
+        renderer=None,
     ):
         self.idb = conn
         self.defs = defs
@@ -154,7 +172,9 @@ class Datablock:
         self.variables = variables
         self.logger = logger
         self.prevous_stage = prevous_stage
-        self.renderer = DummyRenderer(context, DummyAPI(), variables)
+        self.renderer = renderer or DummyRenderer(
+            context, DummyAPI(), variables
+        )
 
     def render(self, query: str):
         return self.renderer.render(query)
@@ -179,7 +199,8 @@ class Datablock:
 
     async def do(self):
         stages = Stages.model_validate(self.defs.stages or [])
-        for step in stages.steps():
+        for step in stages.root:
+            # Sub-blocks share context and variables, hence the renderer
             sub = Datablock(
                 conn=self.idb,
                 defs=step,
@@ -187,6 +208,7 @@ class Datablock:
                 default_connection=self.default_connection,
                 variables=self.variables,
                 logger=self.logger,
+                renderer=self.renderer,
             )
             await sub.transform()
 
@@ -204,17 +226,19 @@ class AsyncFlow:
         self.results = []
 
     async def run(self):
+        # One Datablock (and renderer) serves every step; only defs change
+        db = Datablock(
+            self.conn,
+            None,
+            self.context,
+            self.default_connection,
+            self.variables,
+            self.logger,
+        )
         for defn in self.defs:
-            db = Datablock(
-                self.conn,
-                defn,
-                self.context,
-                self.default_connection,
-                self.variables,
-                self.logger,
-            )
+            db.defs = defn
             await db.transform()
-            self.results.append(db)
+            self.results.append(SimpleNamespace(defs=defn))
 
     async def df(self):
         result = await self.conn.sql("SELECT 1")
@@ -227,11 +251,17 @@ class AsyncFlow:
 
 
 class TestPipeline(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # DummyDDB is stateless: one instance serves every test
+        cls.ddb = DummyDDB(None)
+        cls.ddb_with_df = DummyDDB(FLOW_DF)
+
     async def asyncSetUp(self) -> None:
         self.context = FlowContext(foo="test")
         self.variables = Variables({"loop_control": {"id": 42}})
         self.default_conn = ConnectionConfiguration()
-        self.logger = logging.getLogger("unit_test")
+        self.logger = LOGGER
 
     async def test_render_method_with_loop_control(self):
         dummy_def = DatablockDef(
@@ -240,7 +270,7 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
             query="<< variables['loop_control']['id'] >>",
         )
         db = Datablock(
-            conn=await DummyDDB.connect({}),
+            conn=self.ddb,
             defs=dummy_def,
             context=self.context,
             default_connection=self.default_conn,
@@ -258,7 +288,7 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
             show=5,
         )
         db = Datablock(
-            conn=await DummyDDB.connect({}),
+            conn=self.ddb,
             defs=transform_def,
             context=self.context,
             default_connection=self.default_conn,
@@ -277,7 +307,7 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
             ),
         )
         db = Datablock(
-            conn=await DummyDDB.connect({}),
+            conn=self.ddb,
             defs=sink_def,
             context=self.context,
             default_connection=self.default_conn,
@@ -292,7 +322,7 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
             kind="internal", name="internal_test", query="SELECT 1 AS id"
         )
         db = Datablock(
-            conn=await DummyDDB.connect({}),
+            conn=self.ddb,
             defs=internal_def,
             context=self.context,
             default_connection=self.default_conn,
@@ -319,7 +349,7 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
             ],
         )
         db = Datablock(
-            conn=await DummyDDB.connect({}),
+            conn=self.ddb,
             defs=pipeline_def,
             context=self.context,
             default_connection=self.default_conn,
@@ -344,14 +374,13 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
                 kind="Variable", locator="dummy_sink"
             ),
         )
-        expected_df = pd.DataFrame([{"id": 1, "val": "value"}])
         flow = AsyncFlow(
             defs=[transform_def, sink_def],
             context=self.context,
             default_connection=self.default_conn,
             variables=Variables(),
             logger=self.logger,
-            conn=await DummyDDB.connect({}, dummy_data=expected_df),
+            conn=self.ddb_with_df,
         )
         await flow.run()
         df = await flow.df()
@@ -1,12 +1,13 @@
 import unittest
 import textwrap
 
-from ..common.renderer import Renderer
+from ..common.renderer import Renderer, _compile
 
 class TestRenderer(unittest.TestCase):
 
-    def setUp(self):
-        self.renderer = Renderer(name="Test", value=123)
+    @classmethod
+    def setUpClass(cls):
+        cls.renderer = Renderer(name="Test", value=123)
 
     def test_render_string(self):
         # Test basic string rendering
@@ -79,7 +80,7 @@ class TestRenderer(unittest.TestCase):
         self.assertEqual(result, expected_output)
 
     def test_render_json_multiline_block(self):
-        self.renderer = Renderer(user={"id": 888, "active": True})
+        renderer = Renderer(user={"id": 888, "active": True})
 
         input_json = textwrap.dedent("""\
                 @json{
@@ -87,7 +88,7 @@ class TestRenderer(unittest.TestCase):
                     "active": <<user.active|tojson>>
                 }
             """)
-        result = self.renderer.render(input_json)
+        result = renderer.render(input_json)
 
         expected = {
             "id": 888,
@@ -96,5 +97,27 @@ class TestRenderer(unittest.TestCase):
 
         self.assertEqual(result, expected)
 
+    def test_compiled_template_shared_across_vars(self):
+        self.renderer.render_string("Shared <<name>>")
+        hits = _compile.cache_info().hits
+        other = Renderer(name="Other")
+        self.assertEqual(other.render_string("Shared <<name>>"), "Shared Other")
+        self.assertEqual(_compile.cache_info().hits, hits + 1)
+        self.assertEqual(
+            self.renderer.render_string("Shared <<name>>"), "Shared Test"
+        )
+
+    def test_compiled_template_reused(self):
+        self.renderer.render_string("Again <<name>>")
+        hits = _compile.cache_info().hits
+        self.assertEqual(self.renderer.render_string("Again <<name>>"), "Again Test")
+        self.assertEqual(_compile.cache_info().hits, hits + 1)
+
+    def test_plain_string_skips_template(self):
+        misses = _compile.cache_info().misses
+        self.assertEqual(self.renderer.render_string("  42\n"), 42)
+        self.assertEqual(self.renderer.render_string("no tags"), "no tags")
+        self.assertEqual(_compile.cache_info().misses, misses)
+
 if __name__ == "__main__":
     unittest.main()
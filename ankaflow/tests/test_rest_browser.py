@@ -1,14 +1,17 @@
 # type: ignore
+import asyncio
 import sys
 import types
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 from ..connections.rest import browser as br
 from ..models import rest as rst
 from ..models import enums
 from ..connections.rest import common
+from .support.loop import SharedLoopMixin
 
 # Create mock for pyodide.http.pyfetch
 mock_pyodide_http = types.ModuleType("pyodide.http")
@@ -18,41 +21,70 @@ mock_pyodide_http.pyfetch = AsyncMock()
 mock_pyodide = types.ModuleType("pyodide")
 mock_pyodide.http = mock_pyodide_http
 
-# Register both in sys.modules
-sys.modules["pyodide"] = mock_pyodide
-sys.modules["pyodide.http"] = mock_pyodide_http
-
 # Create a fake 'js' module with the expected structure
 mock_js = types.ModuleType("js")
 mock_js.getHTTPResponse = lambda url, args: None
 
-# Inject the fake module into sys.modules
-sys.modules["js"] = mock_js
+# Installed in sys.modules only while this module's tests run, so
+# other test modules see the real packages.
+_fake_modules = patch.dict(
+    sys.modules,
+    {
+        "pyodide": mock_pyodide,
+        "pyodide.http": mock_pyodide_http,
+        "js": mock_js,
+    },
+)
+
+
+def setUpModule():
+    _fake_modules.start()
+
+
+def tearDownModule():
+    _fake_modules.stop()
+
+
+def _resolved(value) -> asyncio.Future:
+    fut = asyncio.get_running_loop().create_future()
+    fut.set_result(value)
+    return fut
 
 
+@dataclass(slots=True)
 class MockJSResponse:
-    def __init__(
-        self, status=200, ok=True, url="https://example.com", content=b"{}"
-    ):
-        self.status = status
-        self.ok = ok
-        self.url = url
-        self._json = content
+    """
+    JS response stand-in. Body readers return futures resolved at
+    construction, which can be awaited any number of times.
+    """
+
+    status: int = 200
+    ok: bool = True
+    url: str = "https://example.com"
+    content: bytes = b"{}"
+    _text: str = field(init=False)
+    _json_fut: asyncio.Future = field(init=False, repr=False)
+    _text_fut: asyncio.Future = field(init=False, repr=False)
+
+    def __post_init__(self):
+        content = self.content
         self._text = (
             content.decode() if isinstance(content, bytes) else str(content)
         )
+        self._json_fut = _resolved(content)
+        self._text_fut = _resolved(self._text)
 
-    async def json(self):
-        return self._json
+    def json(self):
+        return self._json_fut
 
-    async def text(self):
-        return self._text
+    def text(self):
+        return self._text_fut
 
-    async def bytes(self):
-        return self._json
+    def bytes(self):
+        return self._json_fut
 
 
-class TestRestClient(unittest.IsolatedAsyncioTestCase):
+class TestRestClient(SharedLoopMixin, unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.mock_request = MagicMock(spec=rst.Request)
         self.mock_request.endpoint = "test"
@@ -134,11 +166,15 @@ class TestRestClient(unittest.IsolatedAsyncioTestCase):
             f"{__name__}.br._dispatch_fetch",
             return_value=br.RestLikeResponse(mock_resp, is_js=True),
         ):
-            path = "/tmp/test_stream.txt"
-            result = await self.client.stream("https://example.com/data", path)
-            with open(result) as f:
-                content = f.read()
-            self.assertIn("hello world", content)
+            # Capture the write in memory instead of touching disk
+            with patch.object(br, "open", mock_open(), create=True) as m:
+                path = "test_stream.txt"
+                result = await self.client.stream(
+                    "https://example.com/data", path
+                )
+            self.assertEqual(result, path)
+            m.assert_called_once_with(path, "w", encoding="utf-8")
+            m().write.assert_called_once_with("hello world")
 
 
 if __name__ == "__main__":
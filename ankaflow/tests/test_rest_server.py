@@ -13,43 +13,77 @@ from ..connections.rest.server import (
 from ..models import rest as rst
 from ..models import enums
 from ..common.types import StringDict
+from .support.loop import SharedLoopMixin
+
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+LOGGER.propagate = False
+
+GET = enums.RequestMethod.GET
+POST = enums.RequestMethod.POST
+CT_JSON = enums.ContentType.JSON
+CT_FORM = enums.ContentType.FORM
+# Expected content-type header values
+JSON_HEADERS = {"content-type": CT_JSON.value}
+FORM_HEADERS = {"content-type": CT_FORM.value}
+
+# Responses only read their request, so one instance serves them all
+REQ = httpx.Request("GET", "http://test.com")
+
+
+def _resp(status, **kwargs):
+    return httpx.Response(status, request=REQ, **kwargs)
+
+
+# Attribute names for spec'd mocks, introspected once instead of per mock
+REQUEST_SPEC = dir(rst.Request)
+# Read-only in RestClient, so one instance serves every dummy request
+NO_ERRORHANDLER = rst.RestErrorHandler(condition="", message="")
 
 
 # Helper to create a dummy request with the required attributes.
 def create_dummy_request(
-    method=enums.RequestMethod.GET,
-    content_type=enums.ContentType.JSON,
+    method=GET,
+    content_type=CT_JSON,
     query=None,
     body=None,
     endpoint="/",
     errorhandler=None,
 ):
-    req = MagicMock(spec=rst.Request)
+    req = MagicMock(spec=REQUEST_SPEC)
     req.method = method
     req.content_type = content_type
     req.query = query if query is not None else {}
     req.body = body
     req.endpoint = endpoint
-    # If no errorhandler is provided, use a dummy one.
-    if errorhandler is None:
-        dummy_errorhandler = MagicMock()
-        dummy_errorhandler.condition = ""
-        dummy_errorhandler.message = ""
-        req.errorhandler = dummy_errorhandler
-    else:
-        req.errorhandler = errorhandler
+    # If no errorhandler is provided, use the shared inert one.
+    req.errorhandler = (
+        errorhandler if errorhandler is not None else NO_ERRORHANDLER
+    )
     return req
 
 
-class TestRestClient(unittest.IsolatedAsyncioTestCase):
+class TestRestClient(SharedLoopMixin, unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_config = MagicMock(spec=rst.RestClientConfig)
+        # Connection pool shared by tests that only need a live client;
+        # test_connect/test_disconnect still build their own
+        cls.http_client = httpx.Client(timeout=10)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.http_client.close()
+        super().tearDownClass()
+
     async def asyncSetUp(self):
-        self.mock_config = MagicMock(spec=rst.RestClientConfig)
+        self.mock_config.reset_mock()
         self.mock_config.base_url = "http://test.com"
         self.mock_config.timeout = 10
         # Set auth attribute to avoid AttributeError in connect/disconnect.
         self.mock_config.auth = None
-        self.mock_logger = MagicMock(spec=logging.Logger)
-        self.rest_client = RestClient(self.mock_config, self.mock_logger)
+        self.rest_client = RestClient(self.mock_config, LOGGER)
 
     def test_connect(self):
         # connect() is synchronous.
@@ -110,12 +144,10 @@ class TestRestClient(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(auth, BearerAuth)
 
     def test_headers(self):
-        req = create_dummy_request(content_type=enums.ContentType.JSON)
+        req = create_dummy_request(content_type=CT_JSON)
         self.rest_client.request = req
         headers = self.rest_client.headers()
-        self.assertEqual(
-            headers, {"content-type": enums.ContentType.JSON.value}
-        )
+        self.assertEqual(headers, JSON_HEADERS)
 
     def test_params(self):
         req = create_dummy_request(query={"key": "value"})
@@ -129,136 +161,71 @@ class TestRestClient(unittest.IsolatedAsyncioTestCase):
         payload = self.rest_client.payload()
         self.assertEqual(payload, {"data": "test"})
 
-    def test_arguments_get(self):
-        req = create_dummy_request(
-            method=enums.RequestMethod.GET,
-            query={"key": "value"},
-            content_type=enums.ContentType.JSON,
-        )
-        self.rest_client.request = req
-        args = self.rest_client.arguments()
-        self.assertEqual(
-            args,
-            {
-                "params": {"key": "value"},
-                "headers": {"content-type": enums.ContentType.JSON.value},
-            },
-        )
-
-    def test_arguments_get_with_content_type(self):
-        req = create_dummy_request(
-            method=enums.RequestMethod.GET,
-            query={"key": "value"},
-            content_type=enums.ContentType.JSON,
-        )
-        self.rest_client.request = req
-        args = self.rest_client.arguments()
-        self.assertEqual(
-            args,
-            {
-                "params": {"key": "value"},
-                "headers": {"content-type": enums.ContentType.JSON.value},
-            },
-        )
-
-    def test_arguments_post_form(self):
-        req = create_dummy_request(
-            method=enums.RequestMethod.POST,
-            content_type=enums.ContentType.FORM,
-            body={"data": "test"},
-            query={},
-        )
-        self.rest_client.request = req
-        args = self.rest_client.arguments()
-        self.assertEqual(
-            args,
-            {
-                "params": {},
-                "headers": {"content-type": enums.ContentType.FORM.value},
-                "data": {"data": "test"},
-            },
-        )
-
-    def test_arguments_post_json(self):
-        req = create_dummy_request(
-            method=enums.RequestMethod.POST,
-            content_type=enums.ContentType.JSON,
-            body={"data": "test"},
-            query={},
-        )
+    def test_arguments(self):
+        # (method, content type, body, expected headers, expected extras)
+        cases = [
+            (GET, CT_JSON, None, JSON_HEADERS, {}),
+            (POST, CT_FORM, {"data": "test"}, FORM_HEADERS,
+             {"data": {"data": "test"}}),
+            (POST, CT_JSON, {"data": "test"}, JSON_HEADERS,
+             {"json": {"data": "test"}}),
+        ]
+        req = create_dummy_request(query={"key": "value"})
         self.rest_client.request = req
-        args = self.rest_client.arguments()
-        self.assertEqual(
-            args,
-            {
-                "params": {},
-                "headers": {"content-type": enums.ContentType.JSON.value},
-                "json": {"data": "test"},
-            },
-        )
+        for method, content_type, body, headers, extra in cases:
+            with self.subTest(method=method, content_type=content_type):
+                req.method = method
+                req.content_type = content_type
+                req.body = body
+                args = self.rest_client.arguments()
+                self.assertEqual(
+                    args,
+                    {
+                        "params": {"key": "value"},
+                        "headers": headers,
+                        **extra,
+                    },
+                )
 
     async def test_handle_response_200(self):
         req = create_dummy_request()
         self.rest_client.request = req
-        response = httpx.Response(
-            200, request=httpx.Request("GET", "http://test.com")
-        )
+        response = _resp(200)
         result = await self.rest_client.handle_response(response)
         self.assertEqual(result, response)
 
-    async def test_handle_response_429(self):
-        req = create_dummy_request(body={"data": "test"})
-        self.rest_client.request = req
-        response = httpx.Response(
-            429, request=httpx.Request("GET", "http://test.com")
-        )
-
-        # Patch fetch as an async function.
-        async def fake_fetch(r):
-            return RestResponse(response)
-
-        with patch.object(
-            self.rest_client, "fetch", new=AsyncMock(side_effect=fake_fetch)
-        ) as mock_fetch:
-            result = await self.rest_client.handle_response(response)
-            mock_fetch.assert_called_once_with(req)
-            self.assertEqual(result, response)
-
-    async def test_handle_response_500(self):
-        req = create_dummy_request(body={"data": "test"})
-        self.rest_client.request = req
-        response = httpx.Response(
-            500, request=httpx.Request("GET", "http://test.com")
-        )
-
-        async def fake_fetch(r):
-            return RestResponse(response)
-
-        with patch.object(
-            self.rest_client, "fetch", new=AsyncMock(side_effect=fake_fetch)
-        ) as mock_fetch:
-            result = await self.rest_client.handle_response(response)
-            mock_fetch.assert_called_once_with(req)
-            self.assertEqual(result, response)
-
-    async def test_handle_response_500_no_retry(self):
+    async def test_handle_response_retried(self):
         req = create_dummy_request(body={"data": "test"})
         self.rest_client.request = req
-        self.rest_client.retry = 0  # Disable retries.
-        response = httpx.Response(
-            500, request=httpx.Request("GET", "http://test.com")
-        )
-        with self.assertRaises(common.RestRequestError):
-            await self.rest_client.handle_response(response)
-
-    async def test_handle_response_400(self):
+        for status in (429, 500):
+            with self.subTest(status=status):
+                self.rest_client.retry = 3
+                self.rest_client.wait = 1
+                response = _resp(status)
+
+                # Patch fetch as an async function.
+                async def fake_fetch(r, response=response):
+                    return RestResponse(response)
+
+                with patch.object(
+                    self.rest_client,
+                    "fetch",
+                    new=AsyncMock(side_effect=fake_fetch),
+                ) as mock_fetch:
+                    result = await self.rest_client.handle_response(response)
+                    mock_fetch.assert_called_once_with(req)
+                    self.assertEqual(result, response)
+
+    async def test_handle_response_raises(self):
         req = create_dummy_request(body={"data": "test"})
         self.rest_client.request = req
-        response = httpx.Response(
-            400, request=httpx.Request("GET", "http://test.com")
-        )
-        with self.assertRaises(common.RestRequestError):
-            await self.rest_client.handle_response(response)
+        # (status, retries left); retry=0 disables retries
+        for status, retry in ((400, 3), (500, 0)):
+            with self.subTest(status=status, retry=retry):
+                self.rest_client.retry = retry
+                response = _resp(status)
+                with self.assertRaises(common.RestRequestError):
+                    await self.rest_client.handle_response(response)
 
     async def test_handle_response_error_condition(self):
         # Setup an errorhandler in the request.
@@ -270,11 +237,7 @@ class TestRestClient(unittest.IsolatedAsyncioTestCase):
         )
         self.rest_client.request = req
         response_json = {"status": "error", "message": "Test Error"}
-        response = httpx.Response(
-            200,
-            request=httpx.Request("GET", "http://test.com"),
-            json=response_json,
-        )
+        response = _resp(200, json=response_json)
         with self.assertRaises(common.RestRequestError):
             await self.rest_client.handle_response(response)
 
@@ -283,12 +246,9 @@ class TestRestClient(unittest.IsolatedAsyncioTestCase):
         req.max_retries = 2
         req.initial_backoff = 0.01
 
-        # Ensure httpx.Client is created
-        self.rest_client.connect()
+        self.rest_client.client = self.http_client
 
-        good_response = httpx.Response(
-            200, request=httpx.Request("GET", "http://test.com")
-        )
+        good_response = _resp(200)
         side_effects = [
             httpx.TransportError("network down"),
             httpx.TransportError("connection reset"),
@@ -308,8 +268,7 @@ class TestRestClient(unittest.IsolatedAsyncioTestCase):
         req.max_retries = 1
         req.initial_backoff = 0.01
 
-        # Ensure httpx.Client is created
-        self.rest_client.connect()
+        self.rest_client.client = self.http_client
 
         with patch.object(
             self.rest_client.client,
@@ -5,7 +5,8 @@ from sqlglot import exp
 from ..common.util import (
     build_ranked_query,
     validate_simple_query,
-    make_selectable_func
+    make_selectable_func,
+    parse_sql,
 )
 
 
@@ -47,6 +48,13 @@ class TestBuildRankedQuery(unittest.TestCase):
         self.assertIn('PARTITION BY "id", "region"', sql)
         self.assertEqual(where, 'WHERE "__rank__" = 1')
 
+    def test_parse_sql_returns_independent_trees(self):
+        first = parse_sql("SELECT id FROM users")
+        first.find(exp.Table).replace(exp.to_table("other"))
+        second = parse_sql("SELECT id FROM users")
+        self.assertIsNot(first, second)
+        self.assertEqual(second.sql(), "SELECT id FROM users")
+
 
 class TestValidateSimpleQuery(unittest.TestCase):
     def test_valid_simple_select_passes(self):
@@ -0,0 +1,16 @@
+import asyncio
+import unittest
+
+from .support.loop import SharedLoopMixin
+
+
+class TestSharedLoopMixin(SharedLoopMixin, unittest.IsolatedAsyncioTestCase):
+    def test_per_test_teardown_cancels_leftover_tasks(self):
+        # Sync test: the shared loop is idle, so teardown can drive it
+        loop = self._asyncioRunner.get_loop()
+        task = loop.create_task(asyncio.sleep(3600))
+        self._tearDownAsyncioRunner()
+        self.assertTrue(task.cancelled())
+        # Rebind the shared runner for the case's own teardown
+        self._setupAsyncioRunner()
+        self.assertIs(self._asyncioRunner.get_loop(), loop)
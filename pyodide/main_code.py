@@ -1,8 +1,15 @@
+import copy
+import functools
 import json
 import logging
 import yaml
 from logging.handlers import MemoryHandler
-import traceback
+from pydantic import TypeAdapter
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 
 from ankaflow import AsyncFlow, FlowError, Stages, ConnectionConfiguration, FlowContext
 
@@ -19,16 +26,52 @@ root_logger.setLevel(logging.DEBUG)
 root_logger.addHandler(console_handler)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml(text: str):
+    # The editor resubmits the same definitions
+    return yaml.load(text, Loader=YamlLoader)
+
+
 def parse_yaml(text: str):
     try:
-        return yaml.safe_load(text)
+        # Models keep parsed values by reference (e.g. `t.Any` fields), so
+        # every caller gets its own copy of the cached document
+        return copy.deepcopy(_load_yaml(text))
     except yaml.error.YAMLError as e:
         raise RuntimeError(str(e))
 
 
+# Built once per worker rather than per run
+STAGES_ADAPTER = TypeAdapter(Stages)
+
+
 class BufferHandler(MemoryHandler):
+    separator = "\n----\n"
+
     def logs(self) -> list[str]:
-        return [f"{record.getMessage()}\n----\n" for record in self.buffer]
+        # A single pre-joined entry renders the same as the page joining
+        # one entry per record with "\n"
+        if not self.buffer:
+            return []
+        sep = self.separator
+        body = (sep + "\n").join(map(self.message, self.buffer))
+        return [body + sep]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the traceback now and drop exc_info, so buffered records
+        # don't keep the failing stack's frames alive. Formatters use
+        # exc_text when it is set, so the console output is unchanged.
+        if record.exc_info:
+            if not record.exc_text:
+                fmt = self.formatter or logging.Formatter()
+                record.exc_text = fmt.formatException(record.exc_info)
+            record.exc_info = None
+        super().emit(record)
+
+    def message(self, record: logging.LogRecord) -> str:
+        if record.exc_text:
+            return f"{record.getMessage()}:\n{record.exc_text}"
+        return record.getMessage()
 
 
 async def main(yaml_defs: str, env: dict = None) -> str:
@@ -44,11 +87,11 @@ async def main(yaml_defs: str, env: dict = None) -> str:
     """
     env = env or {}
     model_dict = parse_yaml(yaml_defs)
-    defs = Stages.model_validate(model_dict)
+    defs = STAGES_ADAPTER.validate_python(model_dict)
     opts = ConnectionConfiguration(bucket="/tmp")
     ctx = FlowContext()
 
-    buffer_handler = BufferHandler(1000, flushLevel=logging.DEBUG)
+    buffer_handler = BufferHandler(1000, flushLevel=logging.CRITICAL)
     buffer_handler.setFormatter(formatter)
     logger = logging.getLogger("ankaflow-web")
     logger.setLevel(logging.DEBUG)
@@ -59,8 +102,13 @@ async def main(yaml_defs: str, env: dict = None) -> str:
         await f.run()
         return json.dumps(buffer_handler.logs())
     except FlowError:
-        logger.error("FlowError occurred:\n" + traceback.format_exc())
+        logger.exception("FlowError occurred")
         return json.dumps(buffer_handler.logs())
     except Exception:
-        logger.error("Unhandled error:\n" + traceback.format_exc())
+        logger.exception("Unhandled error")
         return json.dumps(buffer_handler.logs())
+    finally:
+        # Each run attaches its own handler; detach it so the worker
+        # doesn't accumulate handlers and their buffered records
+        logger.removeHandler(buffer_handler)
+        buffer_handler.close()